@@ -6,6 +6,7 @@ Usage:
     python benchmark_visualizer.py <test_name> [args...]
     python benchmark_visualizer.py <test_name> --sys [args...]
     python benchmark_visualizer.py <test_name> --run_all [args...]
+    python benchmark_visualizer.py <test_name> --no-show [args...]
     python benchmark_visualizer.py [runs] [warmup_runs] <test_name> [args...]
     python benchmark_visualizer.py --csv <folder_name>
 
@@ -14,23 +15,27 @@ Examples:
     python benchmark_visualizer.py reproduction --seed 42
     python benchmark_visualizer.py bag --sys
     python benchmark_visualizer.py bag --run_all
+    python benchmark_visualizer.py bag --no-show
     python benchmark_visualizer.py 10 2 gol --sys --seed 42
     python benchmark_visualizer.py --csv benchmarks-con-gol_lib
 """
 
-import math
+import importlib
+import io
 import os
+import re
 import subprocess
 import sys
+import warnings
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
-from scipy.stats import gaussian_kde
-
-# CHANGE THE STUFF IN EXEPATH AND CON/SYS
-import matplotlib.pyplot as plt
 
 # Default test directory (relative to script location)
+# CHANGE THE STUFF IN EXEPATH AND CON/SYS
 if os.name == "nt":
     BUILD_DIR = Path(__file__).parent.parent / "build"
     lib_ext = ".dll"
@@ -42,153 +47,266 @@ else:
     exe_name = "benchmarker"
     DEBUG = ""
 
+# Region type in a CSV name; the greedy prefix picks the last match, which is
+# the _<region> suffix GCBenchmark::write_csv appends to the test name
+REGION_RE = re.compile(r".*(trace|arena|rc|semispace)")
+
+# Plot order of region types, matching the RegionType enum; others go last
+REGION_ORDER = {"trace": 0, "arena": 1, "rc": 2, "semispace": 3}
+
+# key=value pairs on the "#" summary row of a CSV
+META_RE = re.compile(rb"(\w+)=([^,\s]+)")
+
+# Colors for different region types
+COLORS = ["#3498db", "#e74c3c", "#2ecc71", "#9b59b6", "#f39c12"]
+REGION_COLORS = {"trace": COLORS[0], "arena": COLORS[1], "rc": COLORS[2], "semispace": COLORS[3]}
+
+# Bump when the parsed result layout changes, so old .npz caches are ignored
+CSV_CACHE_VERSION = 1
+
+
+# Plotting libraries are loaded lazily, on a background thread
+
+_pyplot_future = None
+
+
+def is_headless(no_show=False):
+    """Return True if the plot should only be saved, not shown."""
+    if no_show or not sys.stdout.isatty():
+        return True
+    # Windows and macOS always have a display; elsewhere X11/Wayland must be set
+    return (
+        os.name == "posix"
+        and sys.platform != "darwin"
+        and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    )
+
+
+def _import_pyplot(headless):
+    import matplotlib
+
+    if headless:
+        # Agg avoids loading a GUI toolkit when the figure is only saved
+        matplotlib.use("Agg")
+    # plot() also needs scipy for the KDE, which is nearly as slow to import
+    importlib.import_module("scipy.stats")
+    plt = importlib.import_module("matplotlib.pyplot")
+    # Skip glyph hinting (about 7% of plot() time) and never shell out to
+    # LaTeX, even if a user's matplotlibrc enables it
+    plt.rcParams.update({"text.hinting": "none", "text.usetex": False})
+    return plt
+
 
-# Helper to get test library extension for platform
+def preload_pyplot(headless=False):
+    """Start importing matplotlib.pyplot on a background thread.
+
+    Loading pyplot and its backend is the slowest part of plotting, so it is
+    overlapped with running the benchmark and parsing the CSVs. This is only
+    started once the arguments are known to be valid, so that bad invocations
+    fail fast.
+    """
+    global _pyplot_future
+    if _pyplot_future is None:
+        _pyplot_future = ThreadPoolExecutor(max_workers=1).submit(_import_pyplot, headless)
+    return _pyplot_future
+
+
+def get_pyplot():
+    """Return matplotlib.pyplot, waiting for the background import if needed."""
+    return preload_pyplot().result()
 
 
 def parse_csv(filepath):
-    """Parse a benchmark CSV file."""
-    results = {"name": Path(filepath).stem, "runs": [], "p50": 0, "p99": 0, "jitter": 0}
-
-    with open(filepath, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("run,"):
-                continue
-            if line.startswith("#"):
-                parts = dict(p.split("=") for p in line[1:].split(",") if "=" in p)
-                results["p50"] = int(parts.get("p50_ns", 0))
-                results["p99"] = int(parts.get("p99_ns", 0))
-                results["jitter"] = float(parts.get("jitter", 0))
-            else:
-                parts = line.split(",")
-                if len(parts) >= 7:
-                    run_time_ns = int(parts[7]) if len(parts) >= 8 else 0
-                    results["runs"].append(
-                        (
-                            int(parts[0]),
-                            int(parts[1]),
-                            int(parts[2]),
-                            int(parts[3]),
-                            int(parts[4]),
-                            int(parts[5]),
-                            int(parts[6]),
-                            run_time_ns,
-                        )
-                    )
+    """Parse a benchmark CSV file.
+
+    Results are cached in a .npz file next to the CSV and reused for as long
+    as the CSV's modification time and size, and the cache format, are
+    unchanged.
+    """
+    filepath = Path(filepath)
+    st = os.stat(filepath)
+    key = f"v{CSV_CACHE_VERSION}_{st.st_mtime_ns}_{st.st_size}"
+    cache_path = filepath.with_suffix(".npz")
+
+    try:
+        with np.load(cache_path) as cached:
+            if str(cached["key"]) == key:
+                return {
+                    "name": filepath.stem,
+                    "runs": cached["runs"],
+                    "p50": int(cached["p50"]),
+                    "p99": int(cached["p99"]),
+                    "jitter": float(cached["jitter"]),
+                }
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+        pass  # Missing, stale or unreadable cache: parse the CSV instead
+
+    results = _parse_csv_file(filepath)
+    tmp_path = cache_path.with_suffix(".npz.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                runs=results["runs"],
+                p50=results["p50"],
+                p99=results["p99"],
+                jitter=results["jitter"],
+                key=key,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best-effort, e.g. the CSV folder may be read-only or full
+        tmp_path.unlink(missing_ok=True)
+    return results
+
+
+def _parse_csv_file(filepath):
+    results = {"name": Path(filepath).stem, "runs": None, "p50": 0, "p99": 0, "jitter": 0}
+
+    # One read of the whole file; mmap measured no faster for these sizes
+    with open(filepath, "rb") as f:
+        buf = f.read()
+
+    # The "#" summary row is the only place a "#" appears
+    meta_start = buf.find(b"#")
+    if meta_start != -1:
+        meta_end = buf.find(b"\n", meta_start)
+        parts = dict(META_RE.findall(buf, meta_start, meta_end if meta_end != -1 else len(buf)))
+        results["p50"] = int(parts.get(b"p50_ns", 0))
+        results["p99"] = int(parts.get(b"p99_ns", 0))
+        results["jitter"] = float(parts.get(b"jitter", 0))
+
+    # Numeric rows are read in a single pass by NumPy's C parser; the header
+    # and the "#" summary row are both skipped as comments.
+    with warnings.catch_warnings():
+        # Files written for a benchmark with no results contain no rows
+        warnings.simplefilter("ignore", UserWarning)
+        try:
+            runs = np.loadtxt(
+                io.BytesIO(buf), delimiter=",", comments=("#", "run,"), dtype=np.int64, ndmin=2
+            )
+        except ValueError:
+            # A benchmark killed mid-write leaves a cut-off last row, which
+            # loadtxt rejects outright; drop rows with fewer than 7 fields
+            # instead, so one bad file does not stop the whole plot
+            rows = [
+                [int(v) for v in fields[:8]] + [0] * (8 - len(fields[:8]))
+                for fields in (line.split(b",") for line in buf.splitlines())
+                if len(fields) >= 7 and not fields[0].startswith((b"#", b"run"))
+            ]
+            runs = np.array(rows, dtype=np.int64).reshape(-1, 8)
+    # A lone cut-off row parses cleanly but is just as short
+    if runs.shape[1] < 7:
+        runs = runs[:0]
+    # Older CSVs have no run_time_ns column
+    if runs.shape[1] < 8:
+        runs = np.pad(runs, ((0, 0), (0, 8 - runs.shape[1])))
+    results["runs"] = runs
     return results
 
 
-def plot_bp(ax, data, labels, box_colors, xlabel, title):
+@lru_cache(maxsize=256)
+def classify_region(stem):
+    """Return the region type named in a CSV file stem, or the stem itself."""
+    m = REGION_RE.match(stem.lower())
+    return m.group(1) if m else stem
+
+
+def list_csv_files(directory):
+    """Return the CSV files directly inside directory."""
+    with os.scandir(directory) as it:
+        return [Path(e.path) for e in it if e.name.endswith(".csv") and e.is_file()]
+
+
+def print_available_benchmarks():
+    """List the benchmarks present in the build tree, to help with a bad test name."""
+    benchmarks_dir = BUILD_DIR / "test" / "benchmarks"
+    print("Available benchmarks:")
+    if benchmarks_dir.is_dir():
+        with os.scandir(benchmarks_dir) as it:
+            for e in it:
+                if e.is_dir():
+                    print(f"  {e.name}")
+
+
+def run_metrics(runs):
+    """Return the per-run metrics plotted for one CSV's (N, 8) run array.
+
+    The result is (avg GC µs, max GC µs, avg memory KB, peak memory KB,
+    run time ms), with runs that recorded no run time left out of the last.
+    """
+    # Runs with no GC calls report 0 rather than dividing by zero
+    avg_gc_us = (
+        np.divide(runs[:, 1], runs[:, 2], out=np.zeros(len(runs)), where=runs[:, 2] > 0) / 1e3
+    )
+    # Max GC time, avg memory and max memory are adjacent columns, so scale
+    # them together and split the result per metric
+    scaled = runs[:, 3:6] / (1e3, 1024, 1024)
+    run_time_ms = runs[runs[:, 7] > 0, 7] / 1e6
+    return avg_gc_us, scaled[:, 0], scaled[:, 1], scaled[:, 2], run_time_ms
+
+
+def plot_bp(ax, data, box_colors, xlabel, title):
     bp = ax.boxplot(data, patch_artist=True, vert=False)
     for patch, color in zip(bp["boxes"], box_colors):
         patch.set_facecolor(color)
         patch.set_edgecolor("black")
-    ax.set_yticks(range(1, len(labels) + 1))
-    ax.set_yticklabels(labels)
-    ax.set_ylabel("Region Type")
-    ax.set_xlabel(xlabel)
-    ax.set_title(title)
-    ax.set_xscale("log")
-    min_val = min([min(vals) for vals in data if vals]) if data else 1
-    max_val = max([max(vals) for vals in data if vals]) if data else 1
-    left_lim = min_val * 0.8
-    right_lim = max_val * 1.9
-    ax.set_xlim(left=left_lim, right=right_lim)
-
-
-def plot(all_results, output_path, test_name=None):
+    min_val = min([vals.min() for vals in data if len(vals)]) if data else 1
+    max_val = max([vals.max() for vals in data if len(vals)]) if data else 1
+    ax.set(
+        xlabel=xlabel,
+        title=title,
+        xscale="log",
+        xlim=(min_val * 0.8, max_val * 1.9),
+    )
+
+
+def plot(all_results, output_path, test_name=None, show=True):
     """Generate a 2x3 plot comparing all region types."""
     if not all_results:
         print("No data to plot")
         return
 
-    fig, axes = plt.subplots(2, 3, figsize=(14, 8))
-
-    # Colors for different region types
-    colors = ["#3498db", "#e74c3c", "#2ecc71", "#9b59b6", "#f39c12"]
-
-    num_types = len(all_results)
-    width = 0.8 / num_types  # Bar width based on number of types
-
-    # Get run numbers from first result (assume all have same runs)
-    first_result = list(all_results.values())[0]
-    runs = [r[0] for r in first_result["runs"]]
-    x = range(len(runs))
-
-    region_color_map = {"trace": colors[0], "arena": colors[1], "rc": colors[2], "semispace": colors[3]}
-    avg_gc_us_data = [
-        [(r[1] / r[2]) / 1e3 for r in results["runs"]]
-        for results in all_results.values()
-    ]
-    max_gc_us_data = [
-        [r[3] / 1e3 for r in results["runs"]] for results in all_results.values()
-    ]
-    avg_mem_kb_data = [
-        [r[4] / 1024 for r in results["runs"]] for results in all_results.values()
-    ]
-    max_mem_kb_data = [
-        [r[5] / 1024 for r in results["runs"]] for results in all_results.values()
-    ]
-    labels = [name for name in all_results.keys()]
-    box_colors = [
-        region_color_map.get(
-            "trace"
-            if "trace" in name
-            else ("arena" if "arena" in name else ("rc" if "rc" in name else ("semispace" if "semispace" in name else None))),
-            colors[idx % len(colors)],
-        )
-        for idx, (name) in enumerate(all_results.keys())
-    ]
-    plot_bp(
-        axes[0, 0],
+    plt = get_pyplot()
+    from scipy.stats import gaussian_kde
+    fig, axes = plt.subplots(2, 3, figsize=(14, 8), constrained_layout=True)
+
+    names = list(all_results)
+    results_list = list(all_results.values())
+    first_result = results_list[0]
+
+    # Gather everything plotted per region type in a single pass
+    metrics = []
+    box_colors = []
+    # Columns: P50, P99, jitter
+    latency = np.empty((len(results_list), 3))
+    for idx, results in enumerate(results_list):
+        metrics.append(run_metrics(results["runs"]))
+        box_colors.append(REGION_COLORS.get(results["region"], COLORS[idx % len(COLORS)]))
+        latency[idx] = results["p50"], results["p99"], results["jitter"]
+    (
         avg_gc_us_data,
-        labels,
-        box_colors,
-        "Avg GC Time (µs)",
-        "Avg GC Time by Region Type",
-    )
-    plot_bp(
-        axes[0, 1],
         max_gc_us_data,
-        labels,
-        box_colors,
-        "Max GC Time (µs)",
-        "Max GC Time by Region Type",
-    )
-    plot_bp(
-        axes[1, 0],
         avg_mem_kb_data,
-        labels,
-        box_colors,
-        "Avg Memory (KB)",
-        "Avg Memory by Region Type",
-    )
-    plot_bp(
-        axes[1, 1],
         max_mem_kb_data,
-        labels,
-        box_colors,
-        "Max Memory (KB)",
-        "Max Memory by Region Type",
-    )
+        run_time_ms_data,
+    ) = zip(*metrics)
+    metric_panels = [
+        (axes[0, 0], avg_gc_us_data, "Avg GC Time (µs)", "Avg GC Time by Region Type"),
+        (axes[0, 1], max_gc_us_data, "Max GC Time (µs)", "Max GC Time by Region Type"),
+        (axes[1, 0], avg_mem_kb_data, "Avg Memory (KB)", "Avg Memory by Region Type"),
+        (axes[1, 1], max_mem_kb_data, "Max Memory (KB)", "Max Memory by Region Type"),
+    ]
+    for ax, data, xlabel, title in metric_panels:
+        plot_bp(ax, data, box_colors, xlabel, title)
+    box_axes = [ax for ax, *_ in metric_panels]
 
     # GC latency distribution (bell curve / KDE on log-scale)
     # KDE is fitted on log-transformed data so distributions at different
     # magnitudes (e.g. arena ~0.1µs vs trace ~200µs) are all visible.
-    for idx, (name, results) in enumerate(all_results.items()):
-        gc_times = [(r[1] / r[2]) / 1e3 for r in results["runs"] if r[2] > 0]
-        if len(gc_times) < 2:
-            continue
-        color = region_color_map.get(
-            "trace" if "trace" in name else (
-                "arena" if "arena" in name else (
-                    "rc" if "rc" in name else (
-                        "semispace" if "semispace" in name else None))),
-            colors[idx % len(colors)],
-        )
-        data = np.array(gc_times)
-        data = data[data > 0]  # log requires positive values
+    kde_lines = []
+    for name, color, gc_times in zip(names, box_colors, avg_gc_us_data):
+        data = gc_times[gc_times > 0]  # log requires positive values
         if len(data) < 2:
             continue
         log_data = np.log10(data)
@@ -203,22 +321,25 @@ def plot(all_results, output_path, test_name=None):
         log_range = log_range[above[0]:above[-1] + 1]
         density = density[above[0]:above[-1] + 1]
         x_range = 10 ** log_range
-        axes[1, 2].plot(x_range, density, label=name, color=color, linewidth=1.5)
+        kde_lines += axes[1, 2].plot(x_range, density, label=name, color=color, linewidth=1.5)
         axes[1, 2].fill_between(x_range, density, alpha=0.15, color=color)
 
-    axes[1, 2].set_xscale("log")
-    axes[1, 2].set_xlabel("Avg GC Time per Run (µs)")
-    axes[1, 2].set_ylabel("Density (log-scale)")
-    axes[1, 2].set_title("GC Latency Distribution")
-    axes[1, 2].legend(fontsize=8, loc="upper left")
+    axes[1, 2].set(
+        xscale="log",
+        xlabel="Avg GC Time per Run (µs)",
+        ylabel="Density (log-scale)",
+        title="GC Latency Distribution",
+    )
+    if kde_lines:
+        axes[1, 2].legend(handles=kde_lines, fontsize=8, loc="upper left")
 
     # P50/P99/jitter info box (upper right, won't overlap legend on upper left)
-    info_lines = []
-    for name, r in all_results.items():
-        p50 = r['p50'] / 1e3
-        p99 = r['p99'] / 1e3
-        jitter = r['jitter'] * 100
-        info_lines.append(f"{name}: P50={p50:.1f}µs  P99={p99:.1f}µs  J={jitter:.1f}%")
+    latency[:, :2] /= 1e3  # ns -> µs
+    latency[:, 2] *= 100  # fraction -> %
+    info_lines = [
+        f"{name}: P50={p50:.1f}µs  P99={p99:.1f}µs  J={jitter:.1f}%"
+        for name, (p50, p99, jitter) in zip(names, latency)
+    ]
     axes[1, 2].text(
         0.98,
         0.98,
@@ -231,26 +352,24 @@ def plot(all_results, output_path, test_name=None):
     )
 
     # Run time boxplot in the previously unused subplot
-    run_time_ms_data = [
-        [r[7] / 1e6 for r in results["runs"] if len(r) > 7 and r[7] > 0]
-        for results in all_results.values()
-    ]
-    if any(run_time_ms_data):
+    if any(len(vals) for vals in run_time_ms_data):
         plot_bp(
             axes[0, 2],
             run_time_ms_data,
-            labels,
             box_colors,
             "Run Time (ms)",
             "Total Run Time by Region Type",
         )
+        box_axes.append(axes[0, 2])
     else:
         axes[0, 2].axis("off")
+    # All boxplots list the region types in the same order
+    plt.setp(box_axes, yticks=range(1, len(names) + 1), yticklabels=names, ylabel="Region Type")
 
     if test_name:
         display_name = test_name.replace("_", " ").replace("-", " ").title()
     else:
-        first_name = list(all_results.values())[0]["name"]
+        first_name = first_result["name"]
         last_underscore = first_name.rfind("_")
         display_name = (
             first_name[:last_underscore] if last_underscore != -1 else first_name
@@ -258,10 +377,13 @@ def plot(all_results, output_path, test_name=None):
     fig.suptitle(
         f"GC Benchmark: {display_name}", fontsize=14, fontweight="bold"
     )
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150)
+    # zlib level 1 encodes much faster than the default 6 for a slightly larger file
+    plt.savefig(output_path, dpi=150, pil_kwargs={"compress_level": 1})
     print(f"Saved: {output_path}")
-    plt.show()
+    # Agg (chosen when headless, or via MPLBACKEND) cannot open a window
+    if show and plt.get_backend().lower() != "agg":
+        plt.show()
+    plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -273,6 +395,12 @@ if __name__ == "__main__":
     if run_all:
         sys.argv.remove("--run_all")
 
+    no_show = "--no-show" in sys.argv
+    if no_show:
+        sys.argv.remove("--no-show")
+
+    headless = is_headless(no_show)
+
     # Argument parsing: python benchmark_visualizer.py --csv <csvfile> | [runs] [warmup_runs] <test_name> [args...]
     args = sys.argv[1:]
     CSV_DIR = Path(__file__).parent.parent / "CSVs"
@@ -286,11 +414,12 @@ if __name__ == "__main__":
         if not target_dir.exists() or not target_dir.is_dir():
             print(f"Error: Directory not found: {target_dir}")
             sys.exit(1)
-        csv_files = list(target_dir.glob("*.csv"))
+        csv_files = list_csv_files(target_dir)
         if not csv_files:
             print(f"No CSV files found in directory '{target_dir}'")
             sys.exit(1)
         # Only plot, skip all test running logic
+        preload_pyplot(headless)
 
     else:
         runs = "5"
@@ -327,30 +456,29 @@ if __name__ == "__main__":
         TEST_DIR = BUILD_DIR / "test" / "benchmarks" / test_name / lib_type / DEBUG
 
         # Delete any existing CSV files first
-        if TEST_DIR.exists():
-            for old_csv in TEST_DIR.glob("*.csv"):
-                old_csv.unlink()
-
-        # List available benchmarks for info
-        benchmarks_dir = BUILD_DIR / "test" / "benchmarks"
-        available_benchmarks = [d.name for d in benchmarks_dir.iterdir() if d.is_dir()] if benchmarks_dir.exists() else []
+        if TEST_DIR.is_dir():
+            for old_csv in list_csv_files(TEST_DIR):
+                try:
+                    os.unlink(old_csv)
+                except FileNotFoundError:
+                    pass  # Already removed since the directory was scanned
 
         # Construct the test library filename: benchmarks-con-<name>_lib.dll
         test_lib_name = f"benchmarks-{prefix}-{test_name}_lib{lib_ext}"
         test_lib_path = TEST_DIR / test_lib_name
-        if not test_lib_path.exists():
+        if not test_lib_path.is_file():
             print(f"Error: Test library not found: {test_lib_path}")
-            print("Available benchmarks:")
-            for bname in available_benchmarks:
-                print(f"  {bname}")
+            print_available_benchmarks()
             sys.exit(1)
 
         # Run benchmarker.exe with the test library as argument
         exe = BUILD_DIR / "src" / "benchmarker" / DEBUG / exe_name
-        if not exe.exists():
+        if not exe.is_file():
             print(f"Error: benchmarker_main not found in {exe.parent}")
             sys.exit(1)
 
+        preload_pyplot(headless)
+
         if run_all:
             gc_types = ["trace", "rc", "arena", "semispace"]
         else:
@@ -369,10 +497,10 @@ if __name__ == "__main__":
                 cmd += [f"--{gc_type}"]
             print(extra_args)
             print(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace")
-            print(result.stdout)
-            if result.stderr:
-                print(result.stderr)
+            # The benchmark writes straight to our stdout/stderr, so its output
+            # appears as it runs and is never copied through Python
+            sys.stdout.flush()
+            subprocess.run(cmd, check=False)
 
         # Find all CSV files created in the CSVs directory under a subdirectory named after the test
         csv_folder_name = test_lib_name.replace(lib_ext, "")
@@ -381,34 +509,29 @@ if __name__ == "__main__":
         if not target_dir.exists() or not target_dir.is_dir():
             print(f"Error: Directory not found: {target_dir}")
             sys.exit(1)
-        csv_files = list(target_dir.glob("*.csv"))
+        csv_files = list_csv_files(target_dir)
         if not csv_files:
             print(f"No CSV files found in directory '{target_dir}'")
-            print("Available benchmarks:")
-            for bname in available_benchmarks:
-                print(f"  {bname}")
+            print_available_benchmarks()
             sys.exit(1)
 
     print(f"\nFound {len(csv_files)} CSV file(s)")
 
+    # Detect region type from filename, then order by region type and name
+    classified = [(classify_region(csv_file.stem), csv_file) for csv_file in csv_files]
+    classified.sort(key=lambda c: (REGION_ORDER.get(c[0], len(REGION_ORDER)), c[1].stem))
+    csv_files = [csv_file for _, csv_file in classified]
+
     # Parse all CSVs and combine into one plot
+    # Threads start instantly and share the already-imported NumPy, so even a
+    # handful of CSVs is worth spreading out; file and cache I/O overlap
+    with ThreadPoolExecutor(max_workers=min(8, len(csv_files))) as ex:
+        parsed = list(ex.map(parse_csv, csv_files))
+
     all_results = {}
     label_counts = {}
-    for csv_file in sorted(csv_files):
-        results = parse_csv(csv_file)
-        stem = Path(csv_file).stem.lower()
-
-        # Detect region type from filename
-        if "trace" in stem:
-            base = "trace"
-        elif "arena" in stem:
-            base = "arena"
-        elif "rc" in stem:
-            base = "rc"
-        elif "semispace" in stem:
-            base = "semispace"
-        else:
-            base = Path(csv_file).stem
+    for (base, _), results in zip(classified, parsed):
+        results["region"] = base
 
         # Ensure unique keys if multiple files map to same region type
         label_counts[base] = label_counts.get(base, 0) + 1
@@ -418,4 +541,4 @@ if __name__ == "__main__":
     # Determine test name for the plot title
     plot_test_name = test_name if test_name else None
     output_file = target_dir / "benchmark_comparison.png"
-    plot(all_results, str(output_file), test_name=plot_test_name)
\ No newline at end of file
+    plot(all_results, str(output_file), test_name=plot_test_name, show=not headless)
\ No newline at end of file